@@ -3,18 +3,28 @@
 Skill Packager - Copies skill folder to dist directory with exclusions
 
 Usage:
-    python build/package_skill.py <skill-folder>
+    python build/package_skill.py <skill-folder> [-v|--verbose]
 
 Example:
     python build/package_skill.py skill-name
 """
 
+import errno
+import os
 import sys
 import shutil
 import re
+import stat
+import tempfile
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 # Files and directories to exclude from packaging
 EXCLUDE_PATTERNS = {
@@ -64,6 +74,57 @@ EXCLUDE_PATTERNS = {
 }
 
 
+def _compile_globs(patterns):
+    """
+    Combine glob patterns into one alternation regex.
+
+    Args:
+        patterns: Iterable of fnmatch-style patterns
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    patterns = sorted(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+# Exclude patterns split by how they are matched: wildcard-free names with
+# a set lookup, other name globs with one alternation regex, and patterns
+# containing "/" against the full relative path
+_EXACT_EXCLUDES = frozenset(
+    p for p in EXCLUDE_PATTERNS if "/" not in p and not any(c in p for c in "*?[")
+)
+EXCLUDE_BASENAME_RE = _compile_globs(
+    p for p in EXCLUDE_PATTERNS if "/" not in p and p not in _EXACT_EXCLUDES
+)
+EXCLUDE_FULLPATH_RE = _compile_globs(p for p in EXCLUDE_PATTERNS if "/" in p)
+
+# Buffer size for the userspace copy fallback
+COPY_BUFSIZE = 1024 * 1024
+
+# Linux FICLONE ioctl request number, _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Per-call byte count for the in-kernel copy primitives; 2**30 also fits
+# the size_t/ssize_t arguments of 32-bit builds
+COPY_CHUNK = 2**30
+
+# Worker threads used to overlap per-file syscall latency while copying
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Without --verbose, report progress once per this many copied files
+PROGRESS_INTERVAL = 1000
+
+# SKILL.md frontmatter checks used by validate_skill; only the head of
+# the file is read unless the frontmatter does not end within it
+FRONTMATTER_READ_SIZE = 8192
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+_NAME_RE = re.compile(r"^\s*name\s*:", re.MULTILINE)
+_DESC_RE = re.compile(r"^\s*description\s*:", re.MULTILINE)
+
+
 def validate_skill(skill_path):
     """
     Basic validation of a skill (simplified, no YAML parsing).
@@ -82,20 +143,23 @@ def validate_skill(skill_path):
         return False, "SKILL.md not found"
 
     # Read and validate frontmatter
-    content = skill_md.read_text()
+    with open(skill_md, "r", encoding="utf-8") as f:
+        content = f.read(FRONTMATTER_READ_SIZE)
+        if not _FRONTMATTER_RE.match(content):
+            content += f.read()
     if not content.startswith("---"):
         return False, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
     frontmatter_text = match.group(1)
 
     # Simple check for required fields (without full YAML parsing)
-    has_name = re.search(r"^\s*name\s*:", frontmatter_text, re.MULTILINE)
-    has_description = re.search(r"^\s*description\s*:", frontmatter_text, re.MULTILINE)
+    has_name = _NAME_RE.search(frontmatter_text)
+    has_description = _DESC_RE.search(frontmatter_text)
 
     if not has_name:
         return False, "Missing 'name' in frontmatter"
@@ -105,48 +169,280 @@ def validate_skill(skill_path):
     return True, "Skill is valid!"
 
 
-def should_exclude(file_path, skill_root):
+def should_exclude(rel_path, name):
     """
-    Check if a file should be excluded from packaging.
+    Check if a file or directory should be excluded from packaging.
+
+    Parent directories are not re-checked: the packaging walk prunes
+    excluded directories before descending into them.
 
     Args:
-        file_path: Path object of the file to check
-        skill_root: Path object of the skill root directory
+        rel_path: Path string relative to the skill root
+        name: Final component of rel_path
 
     Returns:
-        True if file should be excluded, False otherwise
-    """
-    # Get relative path parts
-    rel_path = file_path.relative_to(skill_root)
-    path_parts = rel_path.parts
-
-    # Check each part of the path
-    for part in path_parts:
-        if part in EXCLUDE_PATTERNS:
-            return True
-        # Check wildcard patterns
-        for pattern in EXCLUDE_PATTERNS:
-            if "*" in pattern:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
+        True if the entry should be excluded, False otherwise
+    """
+    if name in _EXACT_EXCLUDES:
+        return True
+    if EXCLUDE_BASENAME_RE and EXCLUDE_BASENAME_RE.match(name):
+        return True
 
     # Check the full relative path
-    rel_path_str = str(rel_path)
-    for pattern in EXCLUDE_PATTERNS:
-        if "*" in pattern:
-            if fnmatch.fnmatch(rel_path_str, pattern):
-                return True
+    if EXCLUDE_FULLPATH_RE and EXCLUDE_FULLPATH_RE.match(rel_path.replace(os.sep, "/")):
+        return True
 
     return False
 
 
-def package_skill(skill_path, output_dir="dist"):
+def _iter_skill_files(skill_root, excluded):
+    """
+    Walk a skill folder with os.scandir, pruning excluded directories.
+
+    Entry types come from the DirEntry cache (d_type on Linux), so no
+    stat call is made per entry. Symlinked directories are not followed.
+
+    Args:
+        skill_root: Path to the skill folder
+        excluded: List that receives (rel_path, is_dir) for each excluded entry
+
+    Yields:
+        Tuples of (rel_path, path) for each file to package
+    """
+    stack = [("", os.fspath(skill_root))]
+    while stack:
+        prefix, dir_path = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if should_exclude(rel_path, entry.name):
+                    excluded.append((rel_path, is_dir))
+                elif is_dir:
+                    stack.append((rel_path + os.sep, entry.path))
+                elif entry.is_file():
+                    yield rel_path, entry.path
+
+
+def _reflink(src_fd, dst_fd):
+    """
+    Clone file data copy-on-write with the FICLONE ioctl (btrfs, XFS).
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+
+    Returns:
+        True if the file was cloned, False if the caller should fall back
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _copy_file_range(src_fd, dst_fd):
+    """
+    Copy file data in-kernel with os.copy_file_range (Linux).
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+
+    Returns:
+        True if the copy completed, False if the caller should fall back
+
+    Raises:
+        OSError: ENOSPC, which no fallback can recover from
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    try:
+        while n := os.copy_file_range(src_fd, dst_fd, COPY_CHUNK):
+            copied += n
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            raise
+        return False
+    # Some filesystems report EOF straight away instead of failing
+    if not copied and os.fstat(src_fd).st_size > 0:
+        return False
+    return True
+
+
+def _sendfile(src_fd, dst_fd):
+    """
+    Copy file data in-kernel with os.sendfile (Linux).
+
+    Other platforms' sendfile needs an integer offset and only writes to
+    sockets, so it is not attempted there.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+
+    Returns:
+        True if the copy completed, False if the caller should fall back
+
+    Raises:
+        OSError: ENOSPC, which no fallback can recover from
+    """
+    if not hasattr(os, "sendfile") or not sys.platform.startswith("linux"):
+        return False
+    copied = 0
+    try:
+        while n := os.sendfile(dst_fd, src_fd, None, COPY_CHUNK):
+            copied += n
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            raise
+        return False
+    # Some filesystems report EOF straight away instead of failing
+    if not copied and os.fstat(src_fd).st_size > 0:
+        return False
+    return True
+
+
+def _fastcopy(src, dst):
+    """
+    Copy a file using the fastest available primitive, then its metadata.
+
+    Tries a FICLONE reflink, then copy_file_range, then sendfile, then a
+    buffered readinto loop. Each strategy continues from the current file
+    offsets, so one that fails midway hands over to the next without
+    losing data.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        if not (
+            _reflink(src_fd, dst_fd)
+            or _copy_file_range(src_fd, dst_fd)
+            or _sendfile(src_fd, dst_fd)
+        ):
+            buf = bytearray(COPY_BUFSIZE)
+            with memoryview(buf) as view:
+                while n := fsrc.readinto(buf):
+                    written = 0
+                    while written < n:
+                        written += os.write(dst_fd, view[written:n])
+    shutil.copystat(src, dst)
+
+
+def _copy_if_changed(pair):
+    """
+    Copy one planned file unless the destination is already up to date.
+
+    A destination with the same size, whole-second mtime and permission
+    bits as the source is treated as unchanged (rsync's quick check, plus
+    the mode since chmod does not touch mtime). A changed file is copied
+    to a temporary file beside the destination and renamed over it.
+
+    Args:
+        pair: Tuple of (rel_path, src, dst)
+
+    Returns:
+        Tuple of (rel_path, copied) where copied is False if skipped
+    """
+    rel_path, src, dst = pair
+    st_src = os.stat(src)
+    try:
+        st_dst = os.lstat(dst)
+    except FileNotFoundError:
+        _fastcopy(src, dst)
+        return rel_path, True
+
+    if (
+        stat.S_ISREG(st_dst.st_mode)
+        and st_src.st_size == st_dst.st_size
+        and int(st_src.st_mtime) == int(st_dst.st_mtime)
+        and stat.S_IMODE(st_src.st_mode) == stat.S_IMODE(st_dst.st_mode)
+    ):
+        return rel_path, False
+
+    # Replace the old copy instead of writing into it: it may be read-only
+    # (copystat gave it the source's mode) or a link to another file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dst), prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        _fastcopy(src, tmp)
+        os.replace(tmp, dst)
+    except Exception:
+        os.unlink(tmp)
+        raise
+    return rel_path, True
+
+
+def _make_dest_dirs(skill_output, rel_paths):
+    """
+    Create the destination directories for a set of files.
+
+    Each unique directory, ancestors included, gets exactly one mkdir
+    call. Sorting puts every parent before its children, so no
+    parents=True probing is needed.
+
+    Args:
+        skill_output: Path to the packaged skill folder (must exist)
+        rel_paths: Relative file paths that will be copied
+    """
+    rel_dirs = set()
+    for rel_path in rel_paths:
+        rel_dir = os.path.dirname(rel_path)
+        while rel_dir and rel_dir not in rel_dirs:
+            rel_dirs.add(rel_dir)
+            rel_dir = os.path.dirname(rel_dir)
+
+    for rel_dir in sorted(rel_dirs):
+        try:
+            os.mkdir(os.path.join(skill_output, rel_dir))
+        except FileExistsError:
+            pass
+
+
+def _remove_stale(skill_output, keep):
+    """
+    Delete files in a previous package that are no longer part of the skill.
+
+    Directories left empty afterwards are removed as well.
+
+    Args:
+        skill_output: Path to the packaged skill folder
+        keep: Set of relative file paths that belong in the package
+
+    Returns:
+        List of removed relative file paths
+    """
+    removed = []
+    top = os.fspath(skill_output)
+    for root, dirs, files in os.walk(top, topdown=False):
+        rel_root = os.path.relpath(root, top)
+        prefix = "" if rel_root == os.curdir else rel_root + os.sep
+        for file_name in files:
+            rel_path = prefix + file_name
+            if rel_path not in keep:
+                os.remove(os.path.join(root, file_name))
+                removed.append(rel_path)
+        if root != top and not os.listdir(root):
+            os.rmdir(root)
+    return removed
+
+
+def package_skill(skill_path, output_dir="dist", verbose=False):
     """
     Package a skill folder to output directory.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Output directory (defaults to 'dist')
+        verbose: Log every copied, excluded and removed entry
 
     Returns:
         Path to the created skill folder, or None if error
@@ -182,10 +478,9 @@ def package_skill(skill_path, output_dir="dist"):
     output_path = Path(output_dir).resolve()
     skill_output = output_path / skill_name
 
-    # Remove existing output if it exists
+    # Existing output is updated in place: unchanged files are kept
     if skill_output.exists():
-        print(f"🗑️  Removing existing output: {skill_output}")
-        shutil.rmtree(skill_output)
+        print(f"♻️  Updating existing output: {skill_output}")
 
     # Create output directory
     skill_output.mkdir(parents=True, exist_ok=True)
@@ -193,34 +488,56 @@ def package_skill(skill_path, output_dir="dist"):
     # Copy files
     try:
         files_added = 0
+        files_unchanged = 0
         files_excluded = 0
+        dirs_excluded = 0
+        pairs = []
 
         print(f"📦 Copying files to {skill_output}\n")
 
-        # Walk through the skill directory
-        for file_path in skill_path.rglob("*"):
-            if file_path.is_file():
-                # Check if file should be excluded
-                if should_exclude(file_path, skill_path):
-                    files_excluded += 1
-                    print(f"  ⊘ Excluded: {file_path.relative_to(skill_path)}")
+        # Walk through the skill directory, pruning excluded directories
+        # so their contents are never visited
+        excluded = []
+        for rel_path, src in _iter_skill_files(skill_path, excluded):
+            pairs.append((rel_path, src, os.path.join(skill_output, rel_path)))
+
+        for rel_path, is_dir in excluded:
+            if is_dir:
+                dirs_excluded += 1
+                if verbose:
+                    print(f"  ⊘ Excluded: {rel_path}/")
+            else:
+                files_excluded += 1
+                if verbose:
+                    print(f"  ⊘ Excluded: {rel_path}")
+
+        # Drop files from a previous package that are no longer wanted
+        removed = _remove_stale(skill_output, {rel for rel, _, _ in pairs})
+        if verbose:
+            for rel_path in removed:
+                print(f"  🗑️  Removed: {rel_path}")
+
+        # Create destination directories up front so workers never mkdir
+        _make_dest_dirs(skill_output, [rel for rel, _, _ in pairs])
+
+        # Copy files concurrently
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            for rel_path, copied in executor.map(_copy_if_changed, pairs):
+                if not copied:
+                    files_unchanged += 1
                     continue
-
-                # Calculate the relative path and destination
-                rel_path = file_path.relative_to(skill_path)
-                dest_path = skill_output / rel_path
-
-                # Create parent directories if needed
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file
-                shutil.copy2(file_path, dest_path)
                 files_added += 1
-                print(f"  ✓ Copied: {rel_path}")
+                if verbose:
+                    print(f"  ✓ Copied: {rel_path}")
+                elif files_added % PROGRESS_INTERVAL == 0:
+                    print(f"  … {files_added} files copied")
 
         print(f"\n📊 Summary:")
         print(f"   Files copied: {files_added}")
+        print(f"   Files unchanged: {files_unchanged}")
+        print(f"   Files removed: {len(removed)}")
         print(f"   Files excluded: {files_excluded}")
+        print(f"   Directories excluded: {dirs_excluded}")
         print(f"\n✅ Successfully packaged skill to: {skill_output}")
         return skill_output
 
@@ -230,18 +547,22 @@ def package_skill(skill_path, output_dir="dist"):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python build/package_skill.py <skill-folder>")
+    args = sys.argv[1:]
+    verbose = "-v" in args or "--verbose" in args
+    args = [arg for arg in args if arg not in ("-v", "--verbose")]
+
+    if len(args) < 1:
+        print("Usage: python build/package_skill.py <skill-folder> [-v|--verbose]")
         print("\nExample:")
         print("  python build/package_skill.py skill-name")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
+    skill_path = args[0]
 
     print(f"📦 Packaging skill to ./dist/")
     print(f"   Source: {skill_path}\n")
 
-    result = package_skill(skill_path)
+    result = package_skill(skill_path, verbose=verbose)
 
     if result:
         sys.exit(0)